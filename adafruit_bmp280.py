@@ -27,16 +27,19 @@ Implementation Notes
 * Adafruit CircuitPython firmware for the supported boards:
   https://github.com/adafruit/circuitpython/releases
 * Adafruit's Bus Device library: https://github.com/adafruit/Adafruit_CircuitPython_BusDevice
+* Adafruit's Ticks library: https://github.com/adafruit/Adafruit_CircuitPython_Ticks
 """
 import math
 import struct
+import sys
 from time import sleep
 
+from adafruit_ticks import ticks_diff, ticks_ms
 from micropython import const
 
 
 try:
-    from typing import Optional
+    from typing import Optional, Tuple
 
     # Used only for type annotations.
     from busio import SPI, I2C
@@ -45,6 +48,22 @@ try:
 except ImportError:
     pass
 
+# The compensation math is deliberately not decorated with @micropython.native
+# or @micropython.viper: they are compiler directives, so the module would fail
+# to compile on builds without the native emitter (most CircuitPython boards),
+# and viper's machine word ints would overflow the 64-bit pressure math.
+#
+# The Bosch integer compensation needs 32-bit intermediate values for temperature
+# and 64-bit ones for pressure. CircuitPython only has integers wider than 30 bits
+# on builds with long int support, and even there each one is a heap allocation,
+# so use the floating point compensation unless machine word ints are 64 bits
+# (as on 64-bit CPython).
+try:
+    _LONG_INT = sys.maxsize > 1 << 47
+except (AttributeError, OverflowError):
+    _LONG_INT = False
+
+
 __version__ = "0.0.0+auto.0"
 __repo__ = "https://github.com/adafruit/Adafruit_CircuitPython_BMP280.git"
 
@@ -59,7 +78,6 @@ _REGISTER_STATUS = const(0xF3)
 _REGISTER_CTRL_MEAS = const(0xF4)
 _REGISTER_CONFIG = const(0xF5)
 _REGISTER_PRESSUREDATA = const(0xF7)
-_REGISTER_TEMPDATA = const(0xFA)
 
 
 """iir_filter values"""
@@ -69,14 +87,6 @@ IIR_FILTER_X4 = const(0x02)
 IIR_FILTER_X8 = const(0x03)
 IIR_FILTER_X16 = const(0x04)
 
-_BMP280_IIR_FILTERS = (
-    IIR_FILTER_DISABLE,
-    IIR_FILTER_X2,
-    IIR_FILTER_X4,
-    IIR_FILTER_X8,
-    IIR_FILTER_X16,
-)
-
 """overscan values for temperature, pressure, and humidity"""
 OVERSCAN_DISABLE = const(0x00)
 OVERSCAN_X1 = const(0x01)
@@ -85,21 +95,15 @@ OVERSCAN_X4 = const(0x03)
 OVERSCAN_X8 = const(0x04)
 OVERSCAN_X16 = const(0x05)
 
-_BMP280_OVERSCANS = {
-    OVERSCAN_DISABLE: 0,
-    OVERSCAN_X1: 1,
-    OVERSCAN_X2: 2,
-    OVERSCAN_X4: 4,
-    OVERSCAN_X8: 8,
-    OVERSCAN_X16: 16,
-}
+# Number of samples taken, indexed by overscan value
+_BMP280_OVERSCANS = (0, 1, 2, 4, 8, 16)
 
 """mode values"""
 MODE_SLEEP = const(0x00)
 MODE_FORCE = const(0x01)
 MODE_NORMAL = const(0x03)
 
-_BMP280_MODES = (MODE_SLEEP, MODE_FORCE, MODE_NORMAL)
+_BMP280_MODES = {MODE_SLEEP, MODE_FORCE, MODE_NORMAL}
 """
 standby timeconstant values
 TC_X[_Y] where X=milliseconds and Y=tenths of a millisecond
@@ -113,7 +117,7 @@ STANDBY_TC_250 = const(0x03)  # 250ms
 STANDBY_TC_500 = const(0x04)  # 500ms
 STANDBY_TC_1000 = const(0x05)  # 1000ms
 
-_BMP280_STANDBY_TCS = (
+_BMP280_STANDBY_TCS = {
     STANDBY_TC_0_5,
     STANDBY_TC_10,
     STANDBY_TC_20,
@@ -122,10 +126,106 @@ _BMP280_STANDBY_TCS = (
     STANDBY_TC_250,
     STANDBY_TC_500,
     STANDBY_TC_1000,
-)
+}
+
+
+if _LONG_INT:
+
+    def _compensate_temperature(raw: int, dig_t1: int, dig_t2: int, dig_t3: int) -> int:
+        """Return t_fine for a raw temperature reading"""
+        # 32-bit integer algorithm from the BMP280 driver
+        # https://github.com/BoschSensortec/BMP280_driver/blob/master/bmp280.c
+        var1 = (((raw >> 3) - (dig_t1 << 1)) * dig_t2) >> 11
+        var2 = (raw >> 4) - dig_t1
+        var2 = (((var2 * var2) >> 12) * dig_t3) >> 14
+        return var1 + var2
+
+    def _compensate_pressure(  # pylint: disable=too-many-arguments
+        raw: int,
+        t_fine: int,
+        dig_p1: int,
+        dig_p2: int,
+        dig_p3: int,
+        dig_p4: int,
+        dig_p5: int,
+        dig_p6: int,
+        dig_p7: int,
+        dig_p8: int,
+        dig_p9: int,
+    ) -> float:
+        """Return the pressure in hectoPascals for a raw pressure reading"""
+        # 64-bit integer algorithm from the BMP280 driver
+        # https://github.com/BoschSensortec/BMP280_driver/blob/master/bmp280.c
+        var1 = t_fine - 128000
+        var2 = var1 * var1 * dig_p6
+        var2 = var2 + ((var1 * dig_p5) << 17)
+        var2 = var2 + (dig_p4 << 35)
+        var1 = ((var1 * var1 * dig_p3) >> 8) + ((var1 * dig_p2) << 12)
+        var1 = (((1 << 47) + var1) * dig_p1) >> 33
+        if not var1:  # avoid exception caused by division by zero
+            raise ArithmeticError(
+                "Invalid result possibly related to error while reading the calibration registers"
+            )
+        pressure = 1048576 - raw
+        pressure = (((pressure << 31) - var2) * 3125) // var1
+        var1 = (dig_p9 * (pressure >> 13) * (pressure >> 13)) >> 25
+        var2 = (dig_p8 * pressure) >> 19
+        pressure = ((pressure + var1 + var2) >> 8) + (dig_p7 << 4)
+
+        # pressure is in Pa as a Q24.8 fixed point value, so hPa is pressure / 25600,
+        # done as a multiplication as that is cheaper than division
+        return pressure * 3.90625e-5
+
+else:
+
+    def _compensate_temperature(
+        raw: int, dig_t1: int, dig_t2: int, dig_t3: int
+    ) -> float:
+        """Return t_fine for a raw temperature reading"""
+        # Floating point algorithm from the BMP280 driver, with the divisions by
+        # constants done as multiplications, as that is cheaper
+        # https://github.com/BoschSensortec/BMP280_driver/blob/master/bmp280.c
+        var1 = (raw * 6.103515625e-05 - dig_t1 * 0.0009765625) * dig_t2
+        var2 = raw * 7.62939453125e-06 - dig_t1 * 0.0001220703125
+        return var1 + var2 * var2 * dig_t3
+
+    def _compensate_pressure(  # pylint: disable=too-many-arguments
+        raw: int,
+        t_fine: int,
+        dig_p1: int,
+        dig_p2: int,
+        dig_p3: int,
+        dig_p4: int,
+        dig_p5: int,
+        dig_p6: int,
+        dig_p7: int,
+        dig_p8: int,
+        dig_p9: int,
+    ) -> float:
+        """Return the pressure in hectoPascals for a raw pressure reading"""
+        # Floating point algorithm from the BMP280 driver, with the divisions by
+        # constants done as multiplications, as that is cheaper
+        # https://github.com/BoschSensortec/BMP280_driver/blob/master/bmp280.c
+        var1 = t_fine * 0.5 - 64000.0
+        var2 = var1 * var1 * dig_p6 * 3.0517578125e-05  # / 32768
+        var2 = var2 + var1 * dig_p5 * 2.0
+        var2 = var2 * 0.25 + dig_p4 * 65536.0
+        var3 = dig_p3 * var1 * var1 * 1.9073486328125e-06  # / 524288
+        var1 = (var3 + dig_p2 * var1) * 1.9073486328125e-06  # / 524288
+        var1 = (1.0 + var1 * 3.0517578125e-05) * dig_p1  # / 32768
+        if not var1:  # avoid exception caused by division by zero
+            raise ArithmeticError(
+                "Invalid result possibly related to error while reading the calibration registers"
+            )
+        pressure = 1048576.0 - raw
+        pressure = ((pressure - var2 * 2.44140625e-04) * 6250.0) / var1  # / 4096
+        var1 = dig_p9 * pressure * pressure * 4.656612873077393e-10  # / 2147483648
+        var2 = pressure * dig_p8 * 3.0517578125e-05  # / 32768
+        pressure = pressure + (var1 + var2 + dig_p7) * 0.0625  # / 16
+        return pressure * 0.01  # Pa to hPa
 
 
-class Adafruit_BMP280:  # pylint: disable=invalid-name
+class Adafruit_BMP280:  # pylint: disable=invalid-name,too-many-instance-attributes
     """Base BMP280 object. Use :class:`Adafruit_BMP280_I2C` or :class:`Adafruit_BMP280_SPI`
     instead of this. This checks the BMP280 was found, reads the coefficients and
     enables the sensor for continuous reads
@@ -145,39 +245,57 @@ class Adafruit_BMP280:  # pylint: disable=invalid-name
         self._iir_filter = IIR_FILTER_DISABLE
         self._overscan_temperature = OVERSCAN_X2
         self._overscan_pressure = OVERSCAN_X16
+        self._update_forced_measurement()
         self._t_standby = STANDBY_TC_0_5
         self._mode = MODE_SLEEP
+        self._use_status_poll = False
+        self._suspend_writes = False
         self._reset()
         self._read_coefficients()
-        self._write_ctrl_meas()
-        self._write_config()
+        self._write_settings()
         self.sea_level_pressure = 1013.25
-        """Pressure in hectoPascals at sea level. Used to calibrate `altitude`."""
+        self.cache_ms = 0
+        """Readings less than this many milliseconds old are reused by `temperature`
+        and `pressure` instead of performing a new measurement. Defaults to 0,
+        which always performs a new measurement. Setting `altitude` reuses
+        readings up to a second old regardless."""
         self._t_fine = None
+        self._raw_pressure = None
+        self._last_read = None
+
+    def _read_raw(self) -> Tuple[int, int]:
+        """Perform one measurement and return the raw (pressure, temperature) ADC values"""
+        # Use the underlying attributes rather than the validating `mode`
+        # property, as this runs on every read
+        if self._mode != MODE_NORMAL:
+            self._mode = MODE_FORCE
+            self._write_register_byte(_REGISTER_CTRL_MEAS, self._forced_ctrl_meas)
+            if self._use_status_poll:
+                # Wait for conversion to complete
+                while self._get_status() & 0x08:
+                    sleep(0.002)
+            else:
+                # Waiting out the worst case conversion time saves the bus
+                # traffic of polling the status register
+                sleep(self._conversion_time)
+        # Burst read both results so they always come from the same conversion
+        data = self._read_register(_REGISTER_PRESSUREDATA, 6)
+        # lowest 4 bits get dropped
+        raw_pressure = ((data[0] << 16) | (data[1] << 8) | data[2]) >> 4
+        raw_temperature = ((data[3] << 16) | (data[4] << 8) | data[5]) >> 4
+        return raw_pressure, raw_temperature
 
     def _read_temperature(self) -> None:
-        # perform one measurement
-        if self.mode != MODE_NORMAL:
-            self.mode = MODE_FORCE
-            # Wait for conversion to complete
-            while self._get_status() & 0x08:
-                sleep(0.002)
-        raw_temperature = (
-            self._read24(_REGISTER_TEMPDATA) / 16
-        )  # lowest 4 bits get dropped
-        # print("raw temp: ", UT)
-        var1 = (
-            raw_temperature / 16384.0 - self._temp_calib[0] / 1024.0
-        ) * self._temp_calib[1]
-        # print(var1)
-        var2 = (
-            (raw_temperature / 131072.0 - self._temp_calib[0] / 8192.0)
-            * (raw_temperature / 131072.0 - self._temp_calib[0] / 8192.0)
-        ) * self._temp_calib[2]
-        # print(var2)
-
-        self._t_fine = int(var1 + var2)
-        # print("t_fine: ", self.t_fine)
+        if (
+            self.cache_ms
+            and self._last_read is not None
+            and ticks_diff(ticks_ms(), self._last_read) < self.cache_ms
+        ):
+            return  # the last reading is still fresh enough
+        # perform one measurement, keeping the raw pressure for `pressure`
+        self._raw_pressure, raw_temperature = self._read_raw()
+        self._last_read = ticks_ms()
+        self._t_fine = _compensate_temperature(raw_temperature, *self._temp_calib)
 
     def _reset(self) -> None:
         """Soft reset the sensor"""
@@ -189,8 +307,23 @@ class Adafruit_BMP280:  # pylint: disable=invalid-name
         Write the values to the ctrl_meas register in the device
         ctrl_meas sets the pressure and temperature data acquisition options
         """
+        if self._suspend_writes:
+            return
         self._write_register_byte(_REGISTER_CTRL_MEAS, self._ctrl_meas)
 
+    def _update_forced_measurement(self) -> None:
+        """
+        Precompute the ctrl_meas value that triggers a forced measurement and
+        the worst case time in seconds it takes, so that reads don't have to.
+        Must be called whenever the overscan settings change.
+        """
+        self._forced_ctrl_meas = (
+            (self._overscan_temperature << 5)
+            | (self._overscan_pressure << 2)
+            | MODE_FORCE
+        )
+        self._conversion_time = self.measurement_time_max / 1000
+
     def _get_status(self) -> int:
         """Get the value from the status register in the device"""
         return self._read_byte(_REGISTER_STATUS)
@@ -200,15 +333,40 @@ class Adafruit_BMP280:  # pylint: disable=invalid-name
         return self._read_byte(_REGISTER_CONFIG)
 
     def _write_config(self) -> None:
-        """Write the value to the config register in the device"""
-        normal_flag = False
+        """Write the value to the config register in the device, along with
+        ctrl_meas, as config writes may be ignored while in Normal mode"""
+        if self._suspend_writes:
+            return
+        self._write_settings()
+
+    def configure(self) -> "_Configuring":
+        """
+        Context manager that batches setting changes. Registers are only written
+        once, when the block exits, instead of after every individual setting.
+        Readings taken inside the block use the settings changed so far.
+
+        .. code-block:: python
+
+            with bmp280.configure():
+                bmp280.overscan_temperature = adafruit_bmp280.OVERSCAN_X2
+                bmp280.overscan_pressure = adafruit_bmp280.OVERSCAN_X16
+                bmp280.iir_filter = adafruit_bmp280.IIR_FILTER_X16
+                bmp280.mode = adafruit_bmp280.MODE_NORMAL
+        """
+        return _Configuring(self)
+
+    def _write_settings(self) -> None:
+        """Write both the ctrl_meas and config registers in the device"""
+        self._last_read = None  # readings taken with the old settings are stale
+        # Writes to the config register may be ignored while in Normal mode, so
+        # switch to Sleep mode first, in the same transaction
+        self._write_register_bytes(
+            _REGISTER_CTRL_MEAS, bytes((self._ctrl_meas & ~MODE_NORMAL, self._config))
+        )
+        # Forced mode is one-shot and triggered again by the next read, so only
+        # Normal mode has to be restarted
         if self._mode == MODE_NORMAL:
-            # Writes to the config register may be ignored while in Normal mode
-            normal_flag = True
-            self.mode = MODE_SLEEP  # So we switch to Sleep mode first
-        self._write_register_byte(_REGISTER_CONFIG, self._config)
-        if normal_flag:
-            self.mode = MODE_NORMAL
+            self._write_ctrl_meas()
 
     @property
     def mode(self) -> int:
@@ -223,6 +381,7 @@ class Adafruit_BMP280:  # pylint: disable=invalid-name
         if not value in _BMP280_MODES:
             raise ValueError("Mode '%s' not supported" % (value))
         self._mode = value
+        self._last_read = None
         self._write_ctrl_meas()
 
     @property
@@ -240,6 +399,7 @@ class Adafruit_BMP280:  # pylint: disable=invalid-name
         if self._t_standby == value:
             return
         self._t_standby = value
+        self._last_read = None
         self._write_config()
 
     @property
@@ -252,9 +412,11 @@ class Adafruit_BMP280:  # pylint: disable=invalid-name
 
     @overscan_temperature.setter
     def overscan_temperature(self, value: int) -> None:
-        if not value in _BMP280_OVERSCANS:
+        if not (isinstance(value, int) and OVERSCAN_DISABLE <= value <= OVERSCAN_X16):
             raise ValueError("Overscan value '%s' not supported" % (value))
         self._overscan_temperature = value
+        self._last_read = None
+        self._update_forced_measurement()
         self._write_ctrl_meas()
 
     @property
@@ -267,9 +429,11 @@ class Adafruit_BMP280:  # pylint: disable=invalid-name
 
     @overscan_pressure.setter
     def overscan_pressure(self, value: int) -> None:
-        if not value in _BMP280_OVERSCANS:
+        if not (isinstance(value, int) and OVERSCAN_DISABLE <= value <= OVERSCAN_X16):
             raise ValueError("Overscan value '%s' not supported" % (value))
         self._overscan_pressure = value
+        self._last_read = None
+        self._update_forced_measurement()
         self._write_ctrl_meas()
 
     @property
@@ -282,16 +446,19 @@ class Adafruit_BMP280:  # pylint: disable=invalid-name
 
     @iir_filter.setter
     def iir_filter(self, value: int) -> None:
-        if not value in _BMP280_IIR_FILTERS:
+        if not (
+            isinstance(value, int) and IIR_FILTER_DISABLE <= value <= IIR_FILTER_X16
+        ):
             raise ValueError("IIR Filter '%s' not supported" % (value))
         self._iir_filter = value
+        self._last_read = None
         self._write_config()
 
     @property
     def _config(self) -> int:
         """Value to be written to the device's config register"""
         config = 0
-        if self.mode == MODE_NORMAL:
+        if self._mode == MODE_NORMAL:
             config += self._t_standby << 5
         if self._iir_filter:
             config += self._iir_filter << 2
@@ -300,36 +467,32 @@ class Adafruit_BMP280:  # pylint: disable=invalid-name
     @property
     def _ctrl_meas(self) -> int:
         """Value to be written to the device's ctrl_meas register"""
-        ctrl_meas = self.overscan_temperature << 5
-        ctrl_meas += self.overscan_pressure << 2
-        ctrl_meas += self.mode
+        ctrl_meas = self._overscan_temperature << 5
+        ctrl_meas += self._overscan_pressure << 2
+        ctrl_meas += self._mode
         return ctrl_meas
 
     @property
     def measurement_time_typical(self) -> float:
         """Typical time in milliseconds required to complete a measurement in normal mode"""
-        meas_time_ms = 1
-        if self.overscan_temperature != OVERSCAN_DISABLE:
-            meas_time_ms += 2 * _BMP280_OVERSCANS.get(self.overscan_temperature)
+        meas_time_ms = 1 + 2 * _BMP280_OVERSCANS[self.overscan_temperature]
         if self.overscan_pressure != OVERSCAN_DISABLE:
-            meas_time_ms += 2 * _BMP280_OVERSCANS.get(self.overscan_pressure) + 0.5
+            meas_time_ms += 2 * _BMP280_OVERSCANS[self.overscan_pressure] + 0.5
         return meas_time_ms
 
     @property
     def measurement_time_max(self) -> float:
         """Maximum time in milliseconds required to complete a measurement in normal mode"""
-        meas_time_ms = 1.25
-        if self.overscan_temperature != OVERSCAN_DISABLE:
-            meas_time_ms += 2.3 * _BMP280_OVERSCANS.get(self.overscan_temperature)
+        meas_time_ms = 1.25 + 2.3 * _BMP280_OVERSCANS[self.overscan_temperature]
         if self.overscan_pressure != OVERSCAN_DISABLE:
-            meas_time_ms += 2.3 * _BMP280_OVERSCANS.get(self.overscan_pressure) + 0.575
+            meas_time_ms += 2.3 * _BMP280_OVERSCANS[self.overscan_pressure] + 0.575
         return meas_time_ms
 
     @property
     def temperature(self) -> float:
         """The compensated temperature in degrees Celsius."""
         self._read_temperature()
-        return self._t_fine / 5120.0
+        return self._t_fine * 1.953125e-4  # / 5120, as multiplying is cheaper
 
     @property
     def pressure(self) -> Optional[float]:
@@ -337,52 +500,85 @@ class Adafruit_BMP280:  # pylint: disable=invalid-name
         The compensated pressure in hectoPascals.
         returns `None` if pressure measurement is disabled
         """
+        if self._overscan_pressure == OVERSCAN_DISABLE:
+            return None
         self._read_temperature()
+        return self._pressure_from_raw()
 
-        # Algorithm from the BMP280 driver
-        # https://github.com/BoschSensortec/BMP280_driver/blob/master/bmp280.c
-        adc = self._read24(_REGISTER_PRESSUREDATA) / 16  # lowest 4 bits get dropped
-        var1 = float(self._t_fine) / 2.0 - 64000.0
-        var2 = var1 * var1 * self._pressure_calib[5] / 32768.0
-        var2 = var2 + var1 * self._pressure_calib[4] * 2.0
-        var2 = var2 / 4.0 + self._pressure_calib[3] * 65536.0
-        var3 = self._pressure_calib[2] * var1 * var1 / 524288.0
-        var1 = (var3 + self._pressure_calib[1] * var1) / 524288.0
-        var1 = (1.0 + var1 / 32768.0) * self._pressure_calib[0]
-        if not var1:  # avoid exception caused by division by zero
-            raise ArithmeticError(
-                "Invalid result possibly related to error while reading the calibration registers"
-            )
-        pressure = 1048576.0 - adc
-        pressure = ((pressure - var2 / 4096.0) * 6250.0) / var1
-        var1 = self._pressure_calib[8] * pressure * pressure / 2147483648.0
-        var2 = pressure * self._pressure_calib[7] / 32768.0
-        pressure = pressure + (var1 + var2 + self._pressure_calib[6]) / 16.0
-        pressure /= 100
+    def _pressure_from_raw(self) -> float:
+        """Compensate the last raw pressure reading and return it in hectoPascals"""
+        return _compensate_pressure(
+            self._raw_pressure, self._t_fine, *self._pressure_calib
+        )
+
+    @property
+    def sea_level_pressure(self) -> float:
+        """Pressure in hectoPascals at sea level. Used to calibrate `altitude`."""
+        return self._sea_level_pressure
 
-        return pressure
+    @sea_level_pressure.setter
+    def sea_level_pressure(self, value: float) -> None:
+        self._sea_level_pressure = value
+        # altitude only needs the reciprocal, so divide once here
+        self._inv_sea_level_pressure = 1.0 / value
 
     @property
-    def altitude(self) -> float:
+    def altitude(self) -> Optional[float]:
         """The altitude based on the sea level pressure (:attr:`sea_level_pressure`)
-        - which you must enter ahead of time)"""
-        p = self.pressure  # in Si units for hPascal
-        return 44330 * (1.0 - math.pow(p / self.sea_level_pressure, 0.1903))
+        - which you must enter ahead of time)
+        returns `None` if pressure measurement is disabled
+
+        Setting it calculates :attr:`sea_level_pressure` from the current pressure,
+        reusing a reading less than a second old if the settings have not changed
+        since it was taken"""
+        pressure = self.pressure
+        if pressure is None:
+            return None
+        return self._altitude(pressure)
+
+    def _altitude(self, p: float) -> float:
+        """Return the altitude for a pressure in hectoPascals"""
+        ratio = p * self._inv_sea_level_pressure
+        r = ratio - 1.0
+        if -0.05 < r < 0.05:
+            # Within 5% of the sea level pressure (roughly +/-420 m) the third order
+            # series of 44330 * (1 - (1 + r) ** 0.1903) is accurate to 0.01 m and
+            # much cheaper than a float power on boards without an FPU.
+            return -r * (8435.999 + r * (-3415.3141951 + r * 2060.2313663))
+        return 44330 * (1.0 - ratio**0.1903)
 
     @altitude.setter
     def altitude(self, value: float) -> None:
-        p = self.pressure  # in Si units for hPascal
+        if self._overscan_pressure == OVERSCAN_DISABLE:
+            raise RuntimeError("Pressure measurement is disabled")
+        if self._last_read is None or ticks_diff(ticks_ms(), self._last_read) >= 1000:
+            self._read_temperature()
+        # else reuse the reading taken less than a second ago; settings changes
+        # clear _last_read, so it was taken with the current settings
+        p = self._pressure_from_raw()  # in Si units for hPascal
         self.sea_level_pressure = p / math.pow(1.0 - value / 44330.0, 5.255)
 
+    def read_all(self) -> Tuple[float, Optional[float], Optional[float]]:
+        """
+        Perform one measurement and return ``(temperature, pressure, altitude)``.
+        Cheaper than reading `temperature`, `pressure` and `altitude` one after
+        the other, as each of those performs its own measurement.
+        Pressure and altitude are `None` if pressure measurement is disabled.
+        """
+        self._read_temperature()
+        temperature = self._t_fine * 1.953125e-4  # / 5120
+        if self._overscan_pressure == OVERSCAN_DISABLE:
+            return temperature, None, None
+        pressure = self._pressure_from_raw()
+        return temperature, pressure, self._altitude(pressure)
+
     ####################### Internal helpers ################################
     def _read_coefficients(self) -> None:
         """Read & save the calibration coefficients"""
         coeff = self._read_register(_REGISTER_DIG_T1, 24)
-        coeff = list(struct.unpack("<HhhHhhhhhhhh", bytes(coeff)))
-        coeff = [float(i) for i in coeff]
-        # The temp_calib lines up with DIG_T# registers.
-        self._temp_calib = coeff[:3]
-        self._pressure_calib = coeff[3:]
+        # The temp_calib lines up with DIG_T# registers, pressure_calib with DIG_P#.
+        self._temp_calib = struct.unpack_from("<Hhh", coeff)
+        self._pressure_calib = struct.unpack_from("<Hhhhhhhhh", coeff, 6)
         # print("%d %d %d" % (self._temp_calib[0], self._temp_calib[1], self._temp_calib[2]))
         # print("%d %d %d" % (self._pressure_calib[0], self._pressure_calib[1],
         #                     self._pressure_calib[2]))
@@ -395,23 +591,44 @@ class Adafruit_BMP280:  # pylint: disable=invalid-name
         """Read a byte register value and return it"""
         return self._read_register(register, 1)[0]
 
-    def _read24(self, register: int) -> float:
-        """Read an unsigned 24-bit value as a floating point and return it."""
-        ret = 0.0
-        for b in self._read_register(register, 3):
-            ret *= 256.0
-            ret += float(b & 0xFF)
-        return ret
-
-    def _read_register(self, register: int, length: int) -> None:
-        """Low level register reading, not implemented in base class"""
+    def _read_register(self, register: int, length: int) -> memoryview:
+        """Low level register reading, not implemented in base class.
+        Reads up to 24 bytes. The returned buffer is only valid until the next
+        register access."""
         raise NotImplementedError()
 
     def _write_register_byte(self, register: int, value: int) -> None:
-        """Low level register writing, not implemented in base class"""
+        """Low level register writing, not implemented in base class.
+        Both the register and the value must already be in the range 0-255."""
+        raise NotImplementedError()
+
+    def _write_register_bytes(self, register: int, values: bytes) -> None:
+        """Low level consecutive register writing, not implemented in base class.
+        The registers and values must already be in the range 0-255."""
         raise NotImplementedError()
 
 
+class _Configuring:
+    """Context manager returned by :meth:`Adafruit_BMP280.configure`"""
+
+    # pylint: disable=protected-access
+
+    def __init__(self, sensor: Adafruit_BMP280) -> None:
+        self._sensor = sensor
+        self._outer_suspended = False
+
+    def __enter__(self) -> Adafruit_BMP280:
+        self._outer_suspended = self._sensor._suspend_writes
+        self._sensor._suspend_writes = True
+        return self._sensor
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._sensor._suspend_writes = self._outer_suspended
+        # When nested, the outermost block writes the settings on exit
+        if not self._outer_suspended:
+            self._sensor._write_settings()
+
+
 class Adafruit_BMP280_I2C(Adafruit_BMP280):  # pylint: disable=invalid-name
     """Driver for I2C connected BMP280.
 
@@ -451,6 +668,12 @@ class Adafruit_BMP280_I2C(Adafruit_BMP280):  # pylint: disable=invalid-name
             pressure = bmp280.pressure
             altitude = bmp280.altitude
 
+        or read all three from a single measurement
+
+        .. code-block:: python
+
+            temperature, pressure, altitude = bmp280.read_all()
+
     """
 
     def __init__(self, i2c: I2C, address: int = 0x77) -> None:
@@ -459,23 +682,45 @@ class Adafruit_BMP280_I2C(Adafruit_BMP280):  # pylint: disable=invalid-name
         )
 
         self._i2c = i2c_device.I2CDevice(i2c, address)
+        # Reusable command and read buffers, so that register I/O doesn't
+        # allocate (and eventually trigger garbage collection)
+        self._cmd = bytearray(2)
+        self._read_buf = memoryview(bytearray(24))
+        # Reusable views of the buffer for the lengths the driver reads
+        self._read_bufs = {length: self._read_buf[:length] for length in (1, 6, 24)}
         super().__init__()
 
-    def _read_register(self, register: int, length: int) -> bytearray:
+    def _read_register(self, register: int, length: int) -> memoryview:
         """Low level register reading over I2C, returns a list of values"""
+        self._cmd[0] = register
+        try:
+            result = self._read_bufs[length]
+        except KeyError:
+            result = self._read_buf[:length]
         with self._i2c as i2c:
-            i2c.write(bytes([register & 0xFF]))
-            result = bytearray(length)
-            i2c.readinto(result)
-            # print("$%02X => %s" % (register, [hex(i) for i in result]))
-            return result
+            # Repeated start: no STOP between selecting the register and reading it
+            i2c.write_then_readinto(self._cmd, result, out_end=1)
+        # print("$%02X => %s" % (register, [hex(i) for i in result]))
+        return result
 
     def _write_register_byte(self, register: int, value: int) -> None:
         """Low level register writing over I2C, writes one 8-bit value"""
+        self._cmd[0] = register
+        self._cmd[1] = value
         with self._i2c as i2c:
-            i2c.write(bytes([register & 0xFF, value & 0xFF]))
+            i2c.write(self._cmd)
             # print("$%02X <= 0x%02X" % (register, value))
 
+    def _write_register_bytes(self, register: int, values: bytes) -> None:
+        """Low level register writing over I2C, writes consecutive 8-bit values"""
+        # Writes don't auto-increment, so send register/value pairs in one transfer
+        buf = bytearray(2 * len(values))
+        for i, value in enumerate(values):
+            buf[2 * i] = register + i
+            buf[2 * i + 1] = value
+        with self._i2c as i2c:
+            i2c.write(buf)
+
 
 class Adafruit_BMP280_SPI(Adafruit_BMP280):
     """Driver for SPI connected BMP280.
@@ -520,6 +765,12 @@ class Adafruit_BMP280_SPI(Adafruit_BMP280):
             pressure = bmp280.pressure
             altitude = bmp280.altitude
 
+        or read all three from a single measurement
+
+        .. code-block:: python
+
+            temperature, pressure, altitude = bmp280.read_all()
+
     """
 
     def __init__(self, spi: SPI, cs: DigitalInOut, baudrate=100000) -> None:
@@ -528,22 +779,49 @@ class Adafruit_BMP280_SPI(Adafruit_BMP280):
         )
 
         self._spi = spi_device.SPIDevice(spi, cs, baudrate=baudrate)
+        # Reusable command and full duplex transfer buffers, so that register
+        # I/O doesn't allocate (and eventually trigger garbage collection)
+        self._cmd = bytearray(2)
+        self._out_buf = bytearray(25)
+        self._in_buf = bytearray(25)
+        # Reusable views of the data bytes of a read, keyed by length
+        self._read_buf = memoryview(self._in_buf)
+        self._read_bufs = {
+            length: self._read_buf[1 : length + 1] for length in (1, 6, 24)
+        }
         super().__init__()
 
-    def _read_register(self, register: int, length: int) -> bytearray:
+    def _read_register(self, register: int, length: int) -> memoryview:
         """Low level register reading over SPI, returns a list of values"""
-        register = (register | 0x80) & 0xFF  # Read single, bit 7 high.
+        # The address goes out in the first byte while the data comes back in
+        # the rest, so the whole read is one transfer with CS held low
+        self._out_buf[0] = register | 0x80  # Read single, bit 7 high.
+        end = length + 1
         with self._spi as spi:
             # pylint: disable=no-member
-            spi.write(bytearray([register]))
-            result = bytearray(length)
-            spi.readinto(result)
-            # print("$%02X => %s" % (register, [hex(i) for i in result]))
-            return result
+            spi.write_readinto(self._out_buf, self._in_buf, out_end=end, in_end=end)
+        try:
+            result = self._read_bufs[length]
+        except KeyError:
+            result = self._read_buf[1:end]
+        # print("$%02X => %s" % (register, [hex(i) for i in result]))
+        return result
 
     def _write_register_byte(self, register: int, value: int) -> None:
         """Low level register writing over SPI, writes one 8-bit value"""
-        register &= 0x7F  # Write, bit 7 low.
+        self._cmd[0] = register & 0x7F  # Write, bit 7 low.
+        self._cmd[1] = value
+        with self._spi as spi:
+            # pylint: disable=no-member
+            spi.write(self._cmd)
+
+    def _write_register_bytes(self, register: int, values: bytes) -> None:
+        """Low level register writing over SPI, writes consecutive 8-bit values"""
+        # Writes don't auto-increment, so send register/value pairs in one transfer
+        buf = bytearray(2 * len(values))
+        for i, value in enumerate(values):
+            buf[2 * i] = (register + i) & 0x7F  # Write, bit 7 low.
+            buf[2 * i + 1] = value
         with self._spi as spi:
             # pylint: disable=no-member
-            spi.write(bytes([register, value & 0xFF]))
+            spi.write(buf)
@@ -180,4 +180,4 @@ texinfo_documents = [
 ]
 
 # API docs fix
-autodoc_mock_imports = ["micropython"]
+autodoc_mock_imports = ["micropython", "adafruit_ticks"]